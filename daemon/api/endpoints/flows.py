@@ -1,9 +1,17 @@
+from typing import List
+
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
 from ..dependencies import FlowDepends
 from ... import Runtime400Exception
-from ...models import DaemonID, ContainerItem, ContainerStoreStatus, FlowModel
+from ...models import (
+    DaemonID,
+    ContainerItem,
+    ContainerStoreStatus,
+    FlowCreateRequest,
+    FlowModel,
+)
 from ...models.enums import UpdateOperation
 from ...stores import flow_store as store
 
@@ -41,6 +49,38 @@ async def _create(flow: FlowDepends = Depends(FlowDepends)):
         raise Runtime400Exception from ex
 
 
+@router.post(
+    path='/bulk',
+    summary='Create multiple Flows from YAML configs in a single request',
+    status_code=201,
+    response_model=List[DaemonID],
+)
+async def _create_bulk(items: List[FlowCreateRequest]):
+    ids = []
+    try:
+        for item in items:
+            flow = FlowDepends(workspace_id=item.workspace_id, filename=item.filename)
+            ids.append(
+                await store.add(
+                    id=flow.id,
+                    workspace_id=flow.workspace_id,
+                    params=flow.params,
+                    ports=flow.ports,
+                    port_expose=flow.port_expose,
+                )
+            )
+    except Exception as ex:
+        # all-or-nothing: without a rollback the caller never learns the ids
+        # of flows already created in this request and cannot clean them up
+        for created_id in ids:
+            try:
+                await store.delete(id=created_id)
+            except Exception:
+                pass  # best-effort; the 400 below reports the original failure
+        raise Runtime400Exception from ex
+    return ids
+
+
 @router.put(
     path='/{id}',
     summary='Run an update operation on the Flow object',
@@ -66,6 +106,18 @@ async def _clear_all():
     await store.clear()
 
 
+@router.delete(
+    path='/bulk',
+    summary='Terminate multiple running Flows in a single request',
+)
+async def _delete_bulk(ids: List[DaemonID]):
+    for id in ids:
+        try:
+            await store.delete(id=id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f'{id} not found in {store!r}')
+
+
 @router.delete(
     path='/{id}',
     summary='Terminate a running Flow',
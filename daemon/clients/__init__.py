@@ -41,6 +41,14 @@ class JinaDClient:
         timeout = timeout
         logger = logger or JinaLogger(self.__class__.__name__)
         self.kwargs = {'uri': uri, 'logger': logger, 'timeout': timeout}
+        # sub-clients are stateful (they hold a connection pool), hence they
+        # are built once & cached, not rebuilt on every property access
+        self._clients: Dict[str, Union[BaseClient, AsyncBaseClient]] = {}
+
+    def _client(self, cls):
+        if cls._kind not in self._clients:
+            self._clients[cls._kind] = cls(**self.kwargs)
+        return self._clients[cls._kind]
 
     @property
     def peas(self):
@@ -48,7 +56,7 @@ class JinaDClient:
 
         :return: Pea Client
         """
-        return self._pea_cls(**self.kwargs)
+        return self._client(self._pea_cls)
 
     @property
     def pods(self) -> Union[PodClient, AsyncPodClient]:
@@ -56,7 +64,7 @@ class JinaDClient:
 
         :return: Pod Client
         """
-        return self._pod_cls(**self.kwargs)
+        return self._client(self._pod_cls)
 
     @property
     def flows(self) -> Union[FlowClient, AsyncFlowClient]:
@@ -64,7 +72,7 @@ class JinaDClient:
 
         :return: Flow Client
         """
-        return self._flow_cls(**self.kwargs)
+        return self._client(self._flow_cls)
 
     @property
     def workspaces(self) -> Union[WorkspaceClient, AsyncWorkspaceClient]:
@@ -72,7 +80,7 @@ class JinaDClient:
 
         :return: Workspace Client
         """
-        return self._workspace_cls(**self.kwargs)
+        return self._client(self._workspace_cls)
 
     @property
     def alive(self) -> bool:
@@ -80,7 +88,7 @@ class JinaDClient:
 
         :return: True if alive
         """
-        return self._base_cls(**self.kwargs).alive()
+        return self._client(self._base_cls).alive()
 
     @property
     def status(self) -> Optional[Dict]:
@@ -88,7 +96,12 @@ class JinaDClient:
 
         :return: Dict object describing remote store
         """
-        return self._base_cls(**self.kwargs).status()
+        return self._client(self._base_cls).status()
+
+    def close(self) -> None:
+        """Close the connection pools of all instantiated sub-clients"""
+        for client in self._clients.values():
+            client.close()
 
 
 class AsyncJinaDClient(JinaDClient):
@@ -106,4 +119,9 @@ class AsyncJinaDClient(JinaDClient):
         :param id: id of the JinaD object
         :return: logs coroutine to be awaited
         """
-        return await self._base_cls(**self.kwargs).logstream(id=id)
+        return await self._client(self._base_cls).logstream(id=id)
+
+    async def close(self) -> None:
+        """Close the connection pools of all instantiated sub-clients"""
+        for client in self._clients.values():
+            await client.close()
@@ -38,6 +38,37 @@ class AsyncBaseClient:
         self.http_uri = f'http://{uri}'
         self.store_api = f'{self.http_uri}{self._endpoint}'
         self.logstream_api = f'ws://{uri}/logstream'
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Get the long-lived session to remote JinaD.
+
+        Unlike `aiohttp.request`, a `ClientSession` holds a connection pool and
+        keeps connections alive across requests, saving one DNS lookup + TCP
+        handshake per call. A session is bound to the event loop it was created
+        on and cannot be awaited from another one, so it is rebuilt whenever the
+        running loop changes (e.g. sync clients get a fresh loop per call).
+
+        :return: aiohttp ClientSession to remote JinaD
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=120)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session to remote JinaD, if it exists"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     @if_alive
     async def alive(self) -> bool:
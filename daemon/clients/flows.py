@@ -1,16 +1,17 @@
 from http import HTTPStatus
-from typing import Union, TYPE_CHECKING, Dict, Optional
-
-import aiohttp
+from typing import List, Tuple, Union, TYPE_CHECKING, Dict, Optional
 
 from ..models.id import daemonize
-from ..helper import if_alive, error_msg_from
+from ..helper import if_alive, error_msg_from, json_loads
 from .base import AsyncBaseClient
 from .mixin import AsyncToSyncMixin
 
 if TYPE_CHECKING:
     from ..models import DaemonID
 
+#: accepted arguments are static per JinaD, hence cached per store uri
+_ARGUMENTS_CACHE: Dict[str, Dict] = {}
+
 
 class AsyncFlowClient(AsyncBaseClient):
     """Async Client to create/update/delete Flows on remote JinaD"""
@@ -22,13 +23,26 @@ class AsyncFlowClient(AsyncBaseClient):
     async def arguments(self) -> Optional[Dict]:
         """Get all arguments accepted by a remote Pea/Pod
 
+        The response is static per JinaD instance, hence it is fetched once
+        and memoized for subsequent calls.
+
         :return: dict arguments of remote JinaD
         """
-        async with aiohttp.request(
+        cached = _ARGUMENTS_CACHE.get(self.store_api)
+        if cached is not None:
+            return cached
+        async with self.session.request(
             method='GET', url=f'{self.store_api}/arguments'
         ) as response:
             if response.status == HTTPStatus.OK:
-                return await response.json()
+                response_json = await response.json(loads=json_loads)
+                _ARGUMENTS_CACHE[self.store_api] = response_json
+                return response_json
+
+    @classmethod
+    def invalidate_arguments_cache(cls) -> None:
+        """Drop all memoized `arguments` responses, e.g. after remote JinaD restarts"""
+        _ARGUMENTS_CACHE.clear()
 
     @if_alive
     async def create(
@@ -42,20 +56,74 @@ class AsyncFlowClient(AsyncBaseClient):
         :param kwargs: keyword args
         :return: flow id
         """
-        async with aiohttp.request(
+        async with self.session.request(
             method='POST',
             url=self.store_api,
             params={'workspace_id': workspace_id, 'filename': filename},
         ) as response:
-            response_json = await response.json()
+            response_json = await response.json(loads=json_loads)
+            if response.status != HTTPStatus.CREATED:
+                error_msg = error_msg_from(response_json)
+                # %-style args are only formatted if the record is emitted
+                self._logger.error(
+                    '%s creation failed as: %s', self._kind.title(), error_msg
+                )
+                return error_msg
+            return response_json
+
+    @if_alive
+    async def bulk_create(
+        self, items: List[Tuple['DaemonID', str]], *args, **kwargs
+    ) -> Union[str, List[str]]:
+        """Start multiple Flows on remote JinaD with a single request
+
+        :param items: list of (workspace id, flow yaml filename) pairs
+        :param args: positional args
+        :param kwargs: keyword args
+        :return: list of flow ids aligned with the order of `items`
+        """
+        async with self.session.request(
+            method='POST',
+            url=f'{self.store_api}/bulk',
+            json=[
+                {'workspace_id': workspace_id, 'filename': filename}
+                for workspace_id, filename in items
+            ],
+        ) as response:
+            response_json = await response.json(loads=json_loads)
             if response.status != HTTPStatus.CREATED:
                 error_msg = error_msg_from(response_json)
                 self._logger.error(
-                    f'{self._kind.title()} creation failed as: {error_msg}'
+                    'bulk %s creation failed as: %s', self._kind.title(), error_msg
                 )
                 return error_msg
             return response_json
 
+    @if_alive
+    async def bulk_delete(
+        self, ids: List[Union[str, 'DaemonID']], *args, **kwargs
+    ) -> bool:
+        """Terminate multiple Flows on remote JinaD with a single request
+
+        :param ids: list of flow ids
+        :param args: positional args
+        :param kwargs: keyword args
+        :return: True if deletion of all flows is successful
+        """
+        async with self.session.request(
+            method='DELETE',
+            url=f'{self.store_api}/bulk',
+            json=[daemonize(id, self._kind) for id in ids],
+        ) as response:
+            response_json = await response.json(loads=json_loads)
+            if response.status != HTTPStatus.OK:
+                self._logger.error(
+                    'bulk deletion of %ss failed: %s',
+                    self._kind.title(),
+                    error_msg_from(response_json),
+                )
+            return response.status == HTTPStatus.OK
+
     @if_alive
     async def delete(self, id: Union[str, 'DaemonID'], *args, **kwargs) -> bool:
         """Terminate a Flow on remote JinaD
@@ -65,14 +133,17 @@ class AsyncFlowClient(AsyncBaseClient):
         :param kwargs: keyword args
         :return: True if deletion is successful
         """
-        async with aiohttp.request(
+        async with self.session.request(
             method='DELETE',
             url=f'{self.store_api}/{daemonize(id, self._kind)}',
         ) as response:
-            response_json = await response.json()
+            response_json = await response.json(loads=json_loads)
             if response.status != HTTPStatus.OK:
                 self._logger.error(
-                    f'deletion of {self._kind.title()} {id} failed: {error_msg_from(response_json)}'
+                    'deletion of %s %s failed: %s',
+                    self._kind.title(),
+                    id,
+                    error_msg_from(response_json),
                 )
             return response.status == HTTPStatus.OK
 
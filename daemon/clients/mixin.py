@@ -16,7 +16,18 @@ class AsyncToSyncMixin:
         """
         f = getattr(super(), func_name, None)
         if f:
-            return run_async(f, any_event_loop=True, *args, **kwargs)
+            close = getattr(super(), 'close', None)
+
+            async def _func_then_close(*args, **kwargs):
+                # `run_async` creates & closes a fresh event loop per call;
+                # a pooled session must not outlive the loop it is bound to
+                try:
+                    return await f(*args, **kwargs)
+                finally:
+                    if close is not None and func_name != 'close':
+                        await close()
+
+            return run_async(_func_then_close, any_event_loop=True, *args, **kwargs)
 
     alive = partialmethod(func, 'alive')
     status = partialmethod(func, 'status')
@@ -24,5 +35,8 @@ class AsyncToSyncMixin:
     list = partialmethod(func, 'list')
     arguments = partialmethod(func, 'arguments')
     create = partialmethod(func, 'create')
+    bulk_create = partialmethod(func, 'bulk_create')
     update = partialmethod(func, 'update')
     delete = partialmethod(func, 'delete')
+    bulk_delete = partialmethod(func, 'bulk_delete')
+    close = partialmethod(func, 'close')
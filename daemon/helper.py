@@ -9,6 +9,14 @@ from .excepts import PartialDaemon400Exception
 if TYPE_CHECKING:
     from .models import DaemonID
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        from json import loads as json_loads
+
 EXCEPTS_REGEX = r'\b(error|failed|FAILURES)\b'
 
 
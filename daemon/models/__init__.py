@@ -13,6 +13,13 @@ PodModel = build_pydantic_model(model_name='PodModel', module='pod')
 PeaModel = build_pydantic_model(model_name='PeaModel', module='pea')
 
 
+class FlowCreateRequest(BaseModel):
+    """Pydantic model for a single Flow creation request inside a bulk call"""
+
+    workspace_id: DaemonID
+    filename: str
+
+
 class DaemonStatus(BaseModel):
     """Pydantic model for DaemonStatus"""
 
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from jina import Flow
@@ -11,6 +12,7 @@ if __name__ == '__main__':
         download_data,
         index_generator,
         query_generator,
+        estimate_request_size,
     )
     from my_executors import MyEncoder, MyIndexer, MyEvaluator, MyConverter
 else:
@@ -20,6 +22,7 @@ else:
         download_data,
         index_generator,
         query_generator,
+        estimate_request_size,
     )
     from .my_executors import MyEncoder, MyIndexer, MyEvaluator, MyConverter
 
@@ -64,11 +67,10 @@ def hello_world(args):
         },
     }
 
-    # download the data
-    download_data(targets, args.download_proxy)
-
-    # reduce the network load by using `fp16`, or even `uint8`
-    os.environ['JINA_ARRAY_QUANT'] = 'fp16'
+    # reduce the network load by quantizing to `fp16`, or even `uint8`;
+    # must be set before any Flow runs
+    if args.array_quant != 'fp32':
+        os.environ['JINA_ARRAY_QUANT'] = args.array_quant
     # now comes the real work
     # load index flow from a YAML file
     f = (
@@ -78,28 +80,49 @@ def hello_world(args):
         .add(uses=MyEvaluator)
     )
 
-    # run it!
-    with f:
-        f.index(
-            index_generator(num_docs=targets['index']['data'].shape[0], target=targets),
-            request_size=args.request_size,
-            show_progress=True,
-        )
-
-        f.post(
-            '/eval',
-            query_generator(
+    # download the data in the background, while the Flow spins up its peas;
+    # both are wall-time heavy and independent of each other
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        download_task = pool.submit(download_data, targets, args.download_proxy)
+
+        # run it!
+        with f:
+            download_task.result()
+
+            # unless given explicitly, size each request by payload bytes
+            # rather than a fixed doc count
+            index_docs = index_generator(
+                num_docs=targets['index']['data'].shape[0], target=targets
+            )
+            if args.request_size:
+                request_size = args.request_size
+            else:
+                request_size, index_docs = estimate_request_size(index_docs)
+            f.index(
+                index_docs,
+                request_size=request_size,
+                show_progress=True,
+            )
+
+            query_docs = query_generator(
                 num_docs=args.num_query, target=targets, with_groundtruth=True
-            ),
-            shuffle=True,
-            on_done=print_result,
-            request_size=args.request_size,
-            parameters={'top_k': args.top_k},
-            show_progress=True,
-        )
-
-        # write result to html
-        write_html(os.path.join(args.workdir, 'demo.html'))
+            )
+            if args.request_size:
+                request_size = args.request_size
+            else:
+                request_size, query_docs = estimate_request_size(query_docs)
+            f.post(
+                '/eval',
+                query_docs,
+                shuffle=True,
+                on_done=print_result,
+                request_size=request_size,
+                parameters={'top_k': args.top_k},
+                show_progress=True,
+            )
+
+            # write result to html
+            write_html(os.path.join(args.workdir, 'demo.html'))
 
 
 if __name__ == '__main__':
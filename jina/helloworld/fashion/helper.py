@@ -1,7 +1,8 @@
+import asyncio
 import gzip
+import itertools
 import os
 import random
-import urllib.request
 import webbrowser
 from collections import defaultdict
 
@@ -9,6 +10,7 @@ import numpy as np
 
 from jina import Document
 from jina.helper import colored
+from jina.importer import ImportExtensions
 from jina.logging.predefined import default_logger
 from jina.logging.profile import ProgressBar
 
@@ -87,6 +89,28 @@ def query_generator(num_docs: int, target: dict, with_groundtruth: bool = True):
             yield d
 
 
+def estimate_request_size(docs, target_bytes: int = 4 * 1024 * 1024):
+    """
+    Estimate a `request_size` so one request carries roughly `target_bytes`.
+
+    Bigger batches amortize the per-request gRPC and serialization overhead,
+    so the batch size is derived from the actual doc size instead of a fixed
+    doc count.
+
+    :param docs: iterator of docs (or (doc, groundtruth) pairs); the first item is sampled
+    :param target_bytes: target payload size of a single request
+    :return: tuple of the estimated request size and the iterator with the sampled item put back
+    """
+    docs = iter(docs)
+    try:
+        first = next(docs)
+    except StopIteration:
+        return 1, iter(())
+    sample = first[0] if isinstance(first, tuple) else first
+    doc_size = max(1, len(sample.binary_str()))
+    return max(1, target_bytes // doc_size), itertools.chain([first], docs)
+
+
 def print_result(resp):
     """
     Callback function to receive results.
@@ -161,24 +185,46 @@ def download_data(targets, download_proxy=None, task_name='download fashion-mnis
     :param download_proxy: download proxy (e.g. 'http', 'https')
     :param task_name: name of the task
     """
-    opener = urllib.request.build_opener()
-    opener.addheaders = [('User-agent', 'Mozilla/5.0')]
-    if download_proxy:
-        proxy = urllib.request.ProxyHandler(
-            {'http': download_proxy, 'https': download_proxy}
-        )
-        opener.add_handler(proxy)
-    urllib.request.install_opener(opener)
-    with ProgressBar(task_name=task_name) as t:
-        for k, v in targets.items():
-            if not os.path.exists(v['filename']):
-                urllib.request.urlretrieve(
-                    v['url'], v['filename'], reporthook=lambda *x: t.update_tick(0.01)
+    with ImportExtensions(
+        required=True,
+        help_text='this demo requires aiohttp to be installed, '
+        'if you haven\'t, please do `pip install jina[aiohttp]`',
+    ):
+        import aiohttp
+
+    async def _download(session, url, filename, t):
+        async with session.get(url, proxy=download_proxy) as response:
+            # surface 404/5xx instead of caching the error page as data
+            response.raise_for_status()
+            # write to a temp name & rename, so an interrupted transfer
+            # isn't mistaken for a finished download on the next run
+            tmp_filename = f'{filename}.tmp'
+            with open(tmp_filename, 'wb') as fp:
+                # stream chunk-wise, the blobs do not fit nicely in memory
+                async for chunk in response.content.iter_chunked(1 << 16):
+                    fp.write(chunk)
+                    t.update_tick(0.01)
+            os.replace(tmp_filename, filename)
+
+    async def _download_all(missing):
+        # all targets share one session, so connections are pooled & kept alive
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=60),
+            headers={'User-Agent': 'Mozilla/5.0'},
+        ) as session:
+            with ProgressBar(task_name=task_name) as t:
+                await asyncio.gather(
+                    *[_download(session, v['url'], v['filename'], t) for v in missing]
                 )
-            if k == 'index-labels' or k == 'query-labels':
-                v['data'] = load_labels(v['filename'])
-            if k == 'index' or k == 'query':
-                v['data'] = load_mnist(v['filename'])
+
+    missing = [v for v in targets.values() if not os.path.exists(v['filename'])]
+    if missing:
+        asyncio.run(_download_all(missing))
+    for k, v in targets.items():
+        if k == 'index-labels' or k == 'query-labels':
+            v['data'] = load_labels(v['filename'])
+        if k == 'index' or k == 'query':
+            v['data'] = load_mnist(v['filename'])
 
 
 def load_mnist(path):
@@ -141,9 +141,19 @@ def set_hw_parser(parser=None):
     gp.add_argument(
         '--request-size',
         type=int,
-        default=1024,
+        default=None,
         help='The request size in indexing (the maximum number of documents that will be included in a '
-        'Request before sending it)',
+        'Request before sending it); if not set, it is estimated from the document size so that '
+        'one request carries roughly 4MB',
+    )
+
+    gp.add_argument(
+        '--array-quant',
+        type=str,
+        choices=['fp32', 'fp16', 'uint8'],
+        default='fp16',
+        help='The quantization applied to ndarrays sent between peas; compared to fp32, '
+        'fp16 halves and uint8 quarters the network traffic, at the cost of precision',
     )
 
     gp.add_argument(
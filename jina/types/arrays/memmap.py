@@ -2,13 +2,17 @@ import itertools
 import mmap
 import os
 import shutil
+import struct
 import tempfile
+from collections import OrderedDict
 from collections.abc import Iterable as Itr
 from pathlib import Path
 from typing import (
     Union,
     Iterable,
     Iterator,
+    List,
+    TYPE_CHECKING,
 )
 
 import numpy as np
@@ -18,8 +22,32 @@ from .search_ops import DocumentArraySearchOpsMixin
 from .traversable import TraversableSequence
 from ..document import Document
 
+if TYPE_CHECKING:
+    from .document import DocumentArray
+
 HEADER_NONE_ENTRY = (-1, -1, -1)
+_TOMBSTONE_TAIL = struct.pack('<qqq', *HEADER_NONE_ENTRY)
 PAGE_SIZE = mmap.ALLOCATIONGRANULARITY
+WRITE_BUFFER_SIZE = 1024 * 1024  #: pending writes are flushed beyond this size
+DOC_CACHE_SIZE = 1024  #: max number of hot Documents memoized by key
+IOV_MAX = 1024  #: max number of buffers submitted to one writev
+
+
+def _writev_all(fp, buffers: List[bytes]) -> None:
+    """Write all `buffers` to `fp` with one `writev` per IOV_MAX chunk.
+
+    :param fp: the target file object, its Python-level buffer is drained first
+    :param buffers: the byte chunks to write, in order
+    """
+    fp.flush()
+    for i in range(0, len(buffers), IOV_MAX):
+        iov = buffers[i : i + IOV_MAX]
+        written = os.writev(fp.fileno(), iov)
+        total = sum(len(b) for b in iov)
+        if written < total:
+            # partial writev, finish the remainder with a plain write
+            fp.write(b''.join(iov)[written:])
+            fp.flush()
 
 
 class DocumentArrayMemmap(
@@ -40,7 +68,7 @@ class DocumentArrayMemmap(
 
     This class is designed to work similarly as :class:`DocumentArray` but differs in the following aspects:
         - one can not set the attribute of elements in a :class:`DocumentArrayMemmap`;
-        - one can not use slice to index elements in a :class:`DocumentArrayMemmap`;
+        - indexing by slice returns a new :class:`DocumentArray`, not a :class:`DocumentArrayMemmap`;
 
     To convert between a :class:`DocumentArrayMemmap` and a :class:`DocumentArray`
 
@@ -63,6 +91,7 @@ class DocumentArrayMemmap(
         self._header_path = os.path.join(path, 'header.bin')
         self._body_path = os.path.join(path, 'body.bin')
         self._key_length = key_length
+        self._hdr_struct = struct.Struct(f'<{key_length}sqqq')
         self._load_header_body()
 
     def reload(self):
@@ -77,8 +106,11 @@ class DocumentArrayMemmap(
 
     def _load_header_body(self, mode: str = 'a'):
         if hasattr(self, '_header'):
+            self._write_buffers()
             self._header.close()
         if hasattr(self, '_body'):
+            if self._body_mmap is not None:
+                self._body_mmap.close()
             self._body.close()
 
         open(self._header_path, mode).close()
@@ -86,31 +118,119 @@ class DocumentArrayMemmap(
 
         self._header = open(self._header_path, 'r+b')
         self._body = open(self._body_path, 'r+b')
-
+        self._header_buf = []
+        self._body_buf = []
+        self._header_buf_size = 0
+        self._body_buf_size = 0
+        self._doc_cache = OrderedDict()
+        self._body_mmap = None
+
+        self._header_entry_size = self._hdr_struct.size
+        header_bytes = self._header.read()
+        if self._is_legacy_header(header_bytes):
+            header_bytes = self._migrate_header(header_bytes)
         tmp = np.frombuffer(
-            self._header.read(),
+            header_bytes,
             dtype=[
-                ('', (np.str_, self._key_length)),  # key_length x 4 bytes
+                ('', f'S{self._key_length}'),  # key_length x 1 byte
                 ('', np.int64),  # 8 bytes
                 ('', np.int64),  # 8 bytes
                 ('', np.int64),  # 8 bytes
             ],
         )
-        self._header_entry_size = 24 + 4 * self._key_length
 
-        self._header_map = {
-            r[0]: (idx, r[1], r[2], r[3])
-            for idx, r in enumerate(tmp)
-            if not np.array_equal((r[1], r[2], r[3]), HEADER_NONE_ENTRY)
-        }
+        # SoA columns of all header entries (incl. tombstones), aligned with the
+        # on-disk row order; the tombstone check is done in one vectorized pass
+        alive = ~(
+            (tmp['f1'] == HEADER_NONE_ENTRY[0])
+            & (tmp['f2'] == HEADER_NONE_ENTRY[1])
+            & (tmp['f3'] == HEADER_NONE_ENTRY[2])
+        )
+        keys = tmp['f0'].astype((np.str_, self._key_length))
+        self._keys = keys.tolist()
+        self._offsets = tmp['f1'].tolist()
+        self._rems = tmp['f2'].tolist()
+        self._ends = tmp['f3'].tolist()
+        self._key_to_idx = dict(
+            zip(keys[alive].tolist(), np.flatnonzero(alive).tolist())
+        )
         self._body_fileno = self._body.fileno()
         self._start = 0
-        if self._header_map:
-            self._start = tmp[-1][1] + tmp[-1][3]
+        if self._key_to_idx:
+            self._start = self._offsets[-1] + self._ends[-1]
             self._body.seek(self._start)
 
+    def _is_legacy_header(self, header_bytes: bytes) -> bool:
+        """Check if `header.bin` still uses the legacy UCS-4 key layout.
+
+        :param header_bytes: content of `header.bin`
+        :return: True if the entries are packed in the legacy layout
+        """
+        if not header_bytes or len(header_bytes) % (24 + 4 * self._key_length) != 0:
+            return False
+        if len(header_bytes) % self._header_entry_size != 0:
+            return True
+        # the size fits both layouts, validate the entries under the compact one:
+        # a genuine entry is either a tombstone or has a page-aligned offset
+        tmp = np.frombuffer(
+            header_bytes,
+            dtype=[
+                ('', f'S{self._key_length}'),
+                ('', np.int64),
+                ('', np.int64),
+                ('', np.int64),
+            ],
+        )
+        tombstone = (
+            (tmp['f1'] == HEADER_NONE_ENTRY[0])
+            & (tmp['f2'] == HEADER_NONE_ENTRY[1])
+            & (tmp['f3'] == HEADER_NONE_ENTRY[2])
+        )
+        valid = tombstone | (
+            (tmp['f1'] >= 0)
+            & (tmp['f1'] % PAGE_SIZE == 0)
+            & (tmp['f2'] >= 0)
+            & (tmp['f3'] >= tmp['f2'])
+        )
+        return not bool(np.all(valid))
+
+    def _migrate_header(self, header_bytes: bytes) -> bytes:
+        """Re-pack a legacy header with UCS-4 keys into the `|S{key_length}` layout.
+
+        :param header_bytes: content of `header.bin` in the legacy layout
+        :return: the same entries with keys stored as 1 byte per char
+        """
+        legacy = np.frombuffer(
+            header_bytes,
+            dtype=[
+                ('', (np.str_, self._key_length)),
+                ('', np.int64),
+                ('', np.int64),
+                ('', np.int64),
+            ],
+        )
+        compact = np.empty(
+            len(legacy),
+            dtype=[
+                ('', f'S{self._key_length}'),
+                ('', np.int64),
+                ('', np.int64),
+                ('', np.int64),
+            ],
+        )
+        compact['f0'] = legacy['f0'].astype(f'S{self._key_length}')
+        for f in ('f1', 'f2', 'f3'):
+            compact[f] = legacy[f]
+        compact_bytes = compact.tobytes()
+        self._header.seek(0)
+        self._header.write(compact_bytes)
+        self._header.truncate()
+        self._header.flush()
+        self._header.seek(0, 2)
+        return compact_bytes
+
     def __len__(self):
-        return len(self._header_map)
+        return len(self._key_to_idx)
 
     def extend(self, values: Iterable['Document']) -> None:
         """Extend the :class:`DocumentArrayMemmap` by appending all the items from the iterable.
@@ -119,6 +239,7 @@ class DocumentArrayMemmap(
         """
         for d in values:
             self.append(d, flush=False)
+        self._write_buffers()
         self._header.flush()
         self._body.flush()
 
@@ -139,34 +260,94 @@ class DocumentArrayMemmap(
         r = (
             self._start % PAGE_SIZE
         )  #: the remainder, i.e. the start position given the offset
-        self._header.write(
-            np.array(
-                (doc.id, p, r, r + l),
-                dtype=[
-                    ('', (np.str_, self._key_length)),
-                    ('', np.int64),
-                    ('', np.int64),
-                    ('', np.int64),
-                ],
-            ).tobytes()
-        )
-        self._header_map[doc.id] = (len(self._header_map), p, r, r + l)
+        self._header_buf.append(self._hdr_struct.pack(doc.id.encode(), p, r, r + l))
+        self._header_buf_size += self._hdr_struct.size
+        self._body_buf.append(value)
+        self._body_buf_size += l
+        self._keys.append(doc.id)
+        self._offsets.append(p)
+        self._rems.append(r)
+        self._ends.append(r + l)
+        self._key_to_idx[doc.id] = len(self._keys) - 1
+        self._doc_cache.pop(doc.id, None)
         self._start = p + r + l
-        self._body.write(value)
+        if (
+            flush
+            or self._header_buf_size >= WRITE_BUFFER_SIZE
+            or self._body_buf_size >= WRITE_BUFFER_SIZE
+        ):
+            self._write_buffers()
         if flush:
             self._header.flush()
             self._body.flush()
 
+    def _get_body_mmap(self, end: int) -> mmap.mmap:
+        """Get the long-lived read mapping of `body.bin`, covering at least `end` bytes.
+
+        The mapping is created once and only re-created after the file has
+        grown beyond it, so reads in the hot path cost no syscall at all.
+
+        :param end: the position in `body.bin` up to which bytes are needed
+        :return: the memory mapping of `body.bin`
+        """
+        if self._body_mmap is None or len(self._body_mmap) < end:
+            if self._body_mmap is not None:
+                self._body_mmap.close()
+            self._body.flush()
+            self._body_mmap = mmap.mmap(self._body_fileno, 0, access=mmap.ACCESS_READ)
+        return self._body_mmap
+
+    def _write_buffers(self) -> None:
+        """Write all pending header & body chunks to disk, one `writev` per file"""
+        if self._header_buf:
+            _writev_all(self._header, self._header_buf)
+            self._header_buf.clear()
+            self._header_buf_size = 0
+        if self._body_buf:
+            _writev_all(self._body, self._body_buf)
+            self._body_buf.clear()
+            self._body_buf_size = 0
+
     def __getitem__(self, key: Union[int, str]) -> 'Document':
         if isinstance(key, str):
-            pos_info = self._header_map[key]
-            _, p, r, l = pos_info
-            with mmap.mmap(self._body_fileno, offset=p, length=l) as m:
-                return Document(m[r:])
+            doc = self._doc_cache.get(key)
+            if doc is not None:
+                self._doc_cache.move_to_end(key)
+                return doc
+            idx = self._key_to_idx[key]
+            p, r, l = self._offsets[idx], self._rems[idx], self._ends[idx]
+            if self._body_buf:
+                self._write_buffers()
+                self._body.flush()
+            # slice the persistent mapping, zero syscall on the hot path
+            doc = Document(self._get_body_mmap(p + l)[p + r : p + l])
+            self._doc_cache[key] = doc
+            if len(self._doc_cache) > DOC_CACHE_SIZE:
+                self._doc_cache.popitem(last=False)
+            return doc
         elif isinstance(key, int):
             return self[self._int2str_id(key)]
+        elif isinstance(key, slice):
+            return self._get_doc_array_by_slice(key)
         else:
-            raise TypeError(f'`key` must be int or str, but receiving {key!r}')
+            raise TypeError(f'`key` must be int, str or slice, but receiving {key!r}')
+
+    def _get_doc_array_by_slice(self, s: slice) -> 'DocumentArray':
+        from .document import DocumentArray
+
+        rows = list(self._key_to_idx.values())[s]
+        da = DocumentArray()
+        if not rows:
+            return da
+        if self._body_buf:
+            self._write_buffers()
+            self._body.flush()
+        end_last = max(self._offsets[idx] + self._ends[idx] for idx in rows)
+        m = self._get_body_mmap(end_last)
+        for idx in rows:
+            p = self._offsets[idx]
+            da.append(Document(m[p + self._rems[idx] : p + self._ends[idx]]))
+        return da
 
     def __delitem__(self, key: Union[int, str]):
         if isinstance(key, str):
@@ -178,45 +359,44 @@ class DocumentArrayMemmap(
         else:
             raise TypeError(f'`key` must be int or str, but receiving {key!r}')
 
-        p = idx * self._header_entry_size
-        self._header.seek(p, 0)
-        self._header.write(
-            np.array(
-                (key, -1, -1, -1),
-                dtype=[
-                    ('', (np.str_, self._key_length)),
-                    ('', np.int64),
-                    ('', np.int64),
-                    ('', np.int64),
-                ],
-            ).tobytes()
-        )
-        self._header.seek(0, 2)
+        self._write_buffers()
         self._header.flush()
-        self._header_map.pop(str_key)
+        key_bytes = str_key.encode()[: self._key_length]
+        os.pwrite(
+            self._header.fileno(),
+            key_bytes.ljust(self._key_length, b'\x00') + _TOMBSTONE_TAIL,
+            idx * self._header_entry_size,
+        )
+        self._key_to_idx.pop(str_key)
+        self._doc_cache.pop(str_key, None)
 
     def _str2int_id(self, key: str) -> int:
-        return self._header_map[key][0]
+        return self._key_to_idx[key]
 
     def _int2str_id(self, key: int) -> str:
-        p = key * self._header_entry_size
-        self._header.seek(p, 0)
-        d_id = np.frombuffer(
-            self._header.read(4 * self._key_length), dtype=(np.str_, self._key_length)
-        )
-        self._header.seek(0, 2)
-        return d_id[0]
+        return self._keys[key]
 
     def __iter__(self) -> Iterator['Document']:
-        for k in self._header_map.keys():
-            yield self[k]
+        if self._body_buf:
+            self._write_buffers()
+            self._body.flush()
+        if not self._key_to_idx:
+            return
+        m = self._get_body_mmap(os.fstat(self._body_fileno).st_size)
+        # full scans index the SoA columns directly, skipping the per-key
+        # dict lookup (and the LRU, which a scan would only thrash)
+        for idx in self._key_to_idx.values():
+            p, r, l = self._offsets[idx], self._rems[idx], self._ends[idx]
+            yield Document(m[p + r : p + l])
 
     def __setitem__(self, key: Union[int, str], value: 'Document') -> None:
         if isinstance(key, int):
             if 0 <= key < len(self):
                 # override an existing entry
                 self.append(value)
-                self._header_map[self._int2str_id(key)] = self._header_map[value.id]
+                old_key = self._int2str_id(key)
+                self._key_to_idx[old_key] = self._key_to_idx[value.id]
+                self._doc_cache.pop(old_key, None)
                 del self[value.id]
             else:
                 raise IndexError(f'`key`={key} is out of range')
@@ -245,18 +425,36 @@ class DocumentArrayMemmap(
         )
 
     def __contains__(self, item: str):
-        return item in self._header_map
+        return item in self._key_to_idx
 
     def prune(self) -> None:
         """Prune deleted Documents from this object, this yields a smaller on-disk storage. """
-        tdir = tempfile.mkdtemp()
-        dam = DocumentArrayMemmap(tdir, key_length=self._key_length)
-        dam.extend(self)
-        dam.reload()
-        os.remove(self._body_path)
-        os.remove(self._header_path)
-        shutil.copy(os.path.join(tdir, 'header.bin'), self._header_path)
-        shutil.copy(os.path.join(tdir, 'body.bin'), self._body_path)
+        self._write_buffers()
+        self._body.flush()
+        # keep the temp files on the same filesystem so they can be renamed
+        # into place instead of copied byte-for-byte
+        tdir = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(self._header_path)))
+        new_header_path = os.path.join(tdir, 'header.bin')
+        new_body_path = os.path.join(tdir, 'body.bin')
+        with open(new_header_path, 'wb') as hfp, open(new_body_path, 'wb') as bfp:
+            start = 0
+            for key, idx in self._key_to_idx.items():
+                p, r, end = self._offsets[idx], self._rems[idx], self._ends[idx]
+                l = end - r
+                new_p = int(start / PAGE_SIZE) * PAGE_SIZE
+                new_r = start % PAGE_SIZE
+                hfp.write(self._hdr_struct.pack(key.encode(), new_p, new_r, new_r + l))
+                # move the live span byte-for-byte, no Document round-trip
+                bfp.write(os.pread(self._body_fileno, l, p + r))
+                start = new_p + new_r + l
+        try:
+            os.replace(new_header_path, self._header_path)
+            os.replace(new_body_path, self._body_path)
+        except OSError:
+            # e.g. EXDEV if the temp dir ended up on another filesystem
+            shutil.copy(new_header_path, self._header_path)
+            shutil.copy(new_body_path, self._body_path)
+        shutil.rmtree(tdir, ignore_errors=True)
         self.reload()
 
     @property
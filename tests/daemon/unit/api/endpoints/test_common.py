@@ -179,3 +179,43 @@ def test_add_fail(api, payload, fastapi_client, workspace):
     response = fastapi_client.get(api)
     assert response.status_code == 200
     assert response.json()['num_add'] == old_add
+
+
+def test_flows_bulk_add_and_delete(fastapi_client, workspace):
+    post_response = fastapi_client.post(
+        '/flows/bulk',
+        json=[
+            {'workspace_id': workspace, 'filename': 'good_flow.yml'},
+            {'workspace_id': workspace, 'filename': 'good_flow_jtype.yml'},
+        ],
+    )
+    assert post_response.status_code == 201
+    ids = post_response.json()
+    assert len(ids) == 2
+    for obj_id in ids:
+        assert obj_id in Dockerizer.containers
+
+    delete_response = fastapi_client.delete('/flows/bulk', json=ids)
+    assert delete_response.status_code == 200
+    time.sleep(1)
+    for obj_id in ids:
+        assert obj_id not in Dockerizer.containers
+
+
+def test_flows_bulk_add_rollback(fastapi_client, workspace):
+    _existing_containers = Dockerizer.containers
+
+    # the second flow fails, so the first one must be rolled back as well
+    response = fastapi_client.post(
+        '/flows/bulk',
+        json=[
+            {'workspace_id': workspace, 'filename': 'good_flow.yml'},
+            {'workspace_id': workspace, 'filename': 'bad_flow.yml'},
+        ],
+    )
+    assert response.status_code == 400
+    for k in ('body', 'detail'):
+        assert k in response.json()
+
+    time.sleep(1)
+    assert Dockerizer.containers == _existing_containers
@@ -38,7 +38,7 @@ class MockAiohttpResponse:
     def status(self):
         return self._status
 
-    async def json(self):
+    async def json(self, loads=None):
         return self._response_json
 
 
@@ -47,6 +47,26 @@ class MockAiohttpException:
         raise aiohttp.ClientConnectionError
 
 
+class MockAiohttpSession:
+    """Mocks the pooled `ClientSession` used by the flows client"""
+
+    def __init__(self, response=None) -> None:
+        self._response = response
+
+    def request(self, **kwargs):
+        if self._response is None:
+            raise aiohttp.ClientConnectionError
+        return self._response
+
+
+def _mock_flow_session(monkeypatch, response=None):
+    monkeypatch.setattr(
+        AsyncBaseClient,
+        'session',
+        property(lambda self: MockAiohttpSession(response)),
+    )
+
+
 @pytest.mark.parametrize('client_cls', all_sync_clients)
 def test_alive(monkeypatch, client_cls):
     client = client_cls(uri=MOCK_URI, logger=logger)
@@ -371,3 +391,166 @@ async def test_peapod_delete_async(monkeypatch, identity, client_cls):
 
     monkeypatch.setattr(aiohttp, 'request', lambda **kwargs: MockAiohttpException())
     assert not await client.delete(identity)
+
+
+def test_flow_create(monkeypatch):
+    client = FlowClient(uri=MOCK_URI, logger=logger)
+    workspace_id = DaemonID('jworkspace')
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse('abcd', 201))
+    assert client.create(workspace_id, 'flow.yml') == 'abcd'
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': [{'msg': 'abcd'}], 'body': 'bad yaml'}, 400),
+    )
+    assert client.create(workspace_id, 'flow.yml') == 'bad yaml'
+
+    _mock_flow_session(monkeypatch)
+    assert client.create(workspace_id, 'flow.yml') is None
+
+
+@pytest.mark.asyncio
+async def test_flow_create_async(monkeypatch):
+    client = AsyncFlowClient(uri=MOCK_URI, logger=logger)
+    workspace_id = DaemonID('jworkspace')
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse('abcd', 201))
+    assert await client.create(workspace_id, 'flow.yml') == 'abcd'
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': [{'msg': 'abcd'}], 'body': 'bad yaml'}, 400),
+    )
+    assert await client.create(workspace_id, 'flow.yml') == 'bad yaml'
+
+    _mock_flow_session(monkeypatch)
+    assert await client.create(workspace_id, 'flow.yml') is None
+
+
+def test_flow_bulk_create(monkeypatch):
+    client = FlowClient(uri=MOCK_URI, logger=logger)
+    items = [
+        (DaemonID('jworkspace'), 'flow1.yml'),
+        (DaemonID('jworkspace'), 'flow2.yml'),
+    ]
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse(['id1', 'id2'], 201))
+    assert client.bulk_create(items) == ['id1', 'id2']
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': [{'msg': 'abcd'}], 'body': 'bad yaml'}, 400),
+    )
+    assert client.bulk_create(items) == 'bad yaml'
+
+    _mock_flow_session(monkeypatch)
+    assert client.bulk_create(items) is None
+
+
+@pytest.mark.asyncio
+async def test_flow_bulk_create_async(monkeypatch):
+    client = AsyncFlowClient(uri=MOCK_URI, logger=logger)
+    items = [
+        (DaemonID('jworkspace'), 'flow1.yml'),
+        (DaemonID('jworkspace'), 'flow2.yml'),
+    ]
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse(['id1', 'id2'], 201))
+    assert await client.bulk_create(items) == ['id1', 'id2']
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': [{'msg': 'abcd'}], 'body': 'bad yaml'}, 400),
+    )
+    assert await client.bulk_create(items) == 'bad yaml'
+
+    _mock_flow_session(monkeypatch)
+    assert await client.bulk_create(items) is None
+
+
+def test_flow_delete(monkeypatch):
+    client = FlowClient(uri=MOCK_URI, logger=logger)
+    identity = DaemonID('jflow')
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse({1: 2}, 200))
+    assert client.delete(identity)
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': 'client error', 'body': 'abc'}, 404),
+    )
+    assert not client.delete(identity)
+
+    _mock_flow_session(monkeypatch)
+    assert not client.delete(identity)
+
+
+@pytest.mark.asyncio
+async def test_flow_delete_async(monkeypatch):
+    client = AsyncFlowClient(uri=MOCK_URI, logger=logger)
+    identity = DaemonID('jflow')
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse({1: 2}, 200))
+    assert await client.delete(identity)
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': 'client error', 'body': 'abc'}, 404),
+    )
+    assert not await client.delete(identity)
+
+    _mock_flow_session(monkeypatch)
+    assert not await client.delete(identity)
+
+
+def test_flow_bulk_delete(monkeypatch):
+    client = FlowClient(uri=MOCK_URI, logger=logger)
+    identities = [DaemonID('jflow'), DaemonID('jflow')]
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse({1: 2}, 200))
+    assert client.bulk_delete(identities)
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': 'client error', 'body': 'abc'}, 404),
+    )
+    assert not client.bulk_delete(identities)
+
+    _mock_flow_session(monkeypatch)
+    assert not client.bulk_delete(identities)
+
+
+@pytest.mark.asyncio
+async def test_flow_bulk_delete_async(monkeypatch):
+    client = AsyncFlowClient(uri=MOCK_URI, logger=logger)
+    identities = [DaemonID('jflow'), DaemonID('jflow')]
+
+    _mock_flow_session(monkeypatch, MockAiohttpResponse({1: 2}, 200))
+    assert await client.bulk_delete(identities)
+
+    _mock_flow_session(
+        monkeypatch,
+        MockAiohttpResponse({'detail': 'client error', 'body': 'abc'}, 404),
+    )
+    assert not await client.bulk_delete(identities)
+
+    _mock_flow_session(monkeypatch)
+    assert not await client.bulk_delete(identities)
+
+
+def test_flow_arguments_cached(monkeypatch):
+    AsyncFlowClient.invalidate_arguments_cache()
+    try:
+        client = FlowClient(uri=MOCK_URI, logger=logger)
+        _mock_flow_session(monkeypatch, MockAiohttpResponse({'name': {}}, 200))
+        assert client.arguments() == {'name': {}}
+
+        # subsequent calls are served from the cache, the session isn't touched
+        _mock_flow_session(monkeypatch)
+        assert client.arguments() == {'name': {}}
+
+        AsyncFlowClient.invalidate_arguments_cache()
+        assert client.arguments() is None
+    finally:
+        AsyncFlowClient.invalidate_arguments_cache()
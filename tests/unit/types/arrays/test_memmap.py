@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pytest
 
 from jina import Document, DocumentArray
@@ -22,6 +23,50 @@ def test_memmap_append_extend(tmpdir):
         assert d1.proto == d2.proto
 
 
+def test_memmap_header_migration(tmpdir):
+    dam = DocumentArrayMemmap(tmpdir)
+    docs = list(random_docs(10))
+    dam.extend(docs)
+    # rewrite the header in the legacy UCS-4 key layout
+    legacy = np.array(
+        [
+            (dam._keys[i], dam._offsets[i], dam._rems[i], dam._ends[i])
+            for i in range(len(dam._keys))
+        ],
+        dtype=[
+            ('', (np.str_, dam._key_length)),
+            ('', np.int64),
+            ('', np.int64),
+            ('', np.int64),
+        ],
+    )
+    with open(os.path.join(tmpdir, 'header.bin'), 'wb') as fp:
+        fp.write(legacy.tobytes())
+
+    dam2 = DocumentArrayMemmap(tmpdir)
+    assert len(dam2) == 10
+    for d1, d2 in zip(docs, dam2):
+        assert d1.proto == d2.proto
+    # migration is one-shot, the header is re-packed on disk
+    assert os.stat(os.path.join(tmpdir, 'header.bin')).st_size == 10 * (
+        24 + dam._key_length
+    )
+
+
+def test_memmap_get_by_slice(tmpdir):
+    dam = DocumentArrayMemmap(tmpdir)
+    docs = list(random_docs(100))
+    dam.extend(docs)
+    da = dam[10:20]
+    assert isinstance(da, DocumentArray)
+    assert len(da) == 10
+    for d1, d2 in zip(docs[10:20], da):
+        assert d1.proto == d2.proto
+    assert len(dam[90:]) == 10
+    assert len(dam[::2]) == 50
+    assert len(dam[100:]) == 0
+
+
 @pytest.mark.parametrize('idx1, idx99', [(1, 99), ('id_1', 'id_99')])
 def test_memmap_delete_clear(tmpdir, mocker, idx1, idx99):
     dam = DocumentArrayMemmap(tmpdir)